@@ -0,0 +1,28 @@
+"""Regression benchmarks for the grading hot path.
+
+Not collected by a plain ``pytest`` run; see CONTRIBUTING.md.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bifrost_eval.core.scorer import Scorer, ThresholdGrader, WeightedGrader
+from tests.conftest import make_outcome
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_bench_threshold_grade(benchmark: BenchmarkFixture) -> None:
+    benchmark(ThresholdGrader().grade, make_outcome(0.8))
+
+
+def test_bench_weighted_grade(benchmark: BenchmarkFixture) -> None:
+    grader = WeightedGrader(required_scores={"acc": 0.5})
+    benchmark(grader.grade, make_outcome(0.8))
+
+
+def test_bench_apply_grade(benchmark: BenchmarkFixture) -> None:
+    # apply_grade is idempotent, so re-grading the same outcome measures the steady state
+    benchmark(Scorer().apply_grade, make_outcome(0.8))
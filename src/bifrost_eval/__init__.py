@@ -1,29 +1,63 @@
 """bifrost-eval: MCP pipeline evaluation toolkit."""
 
-from bifrost_eval.adapters.comparison import ComparisonResult, ComparisonRunner
-from bifrost_eval.core.metrics import (
-    AccuracyMetric,
-    CostEfficiencyMetric,
-    LatencyMetric,
-    Metric,
-    ToolCorrectnessMetric,
-)
-from bifrost_eval.core.runner import EvalRunner, ExecutionTrace, PipelineExecutor
-from bifrost_eval.core.scorer import GradingStrategy, Scorer, ThresholdGrader, WeightedGrader
-from bifrost_eval.models.evaluation import (
-    CostBreakdown,
-    EvalResult,
-    EvalScore,
-    EvalSuite,
-    GradeLevel,
-    LatencyBreakdown,
-    Scenario,
-    ScenarioOutcome,
-    ToolCallRecord,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bifrost_eval.adapters.comparison import ComparisonResult, ComparisonRunner
+    from bifrost_eval.core.metrics import (
+        AccuracyMetric,
+        CostEfficiencyMetric,
+        LatencyMetric,
+        Metric,
+        ToolCorrectnessMetric,
+    )
+    from bifrost_eval.core.runner import EvalRunner, ExecutionTrace, PipelineExecutor
+    from bifrost_eval.core.scorer import GradingStrategy, Scorer, ThresholdGrader, WeightedGrader
+    from bifrost_eval.models.evaluation import (
+        CostBreakdown,
+        EvalResult,
+        EvalScore,
+        EvalSuite,
+        GradeLevel,
+        LatencyBreakdown,
+        Scenario,
+        ScenarioOutcome,
+        ToolCallRecord,
+    )
 
 __version__ = "0.2.0"
 
+# Public names are imported on first access (PEP 562), so `import bifrost_eval`
+# and the CLI don't pay for pydantic and the evaluation engine up front.
+_EXPORTS: dict[str, str] = {
+    "AccuracyMetric": "bifrost_eval.core.metrics",
+    "ComparisonResult": "bifrost_eval.adapters.comparison",
+    "ComparisonRunner": "bifrost_eval.adapters.comparison",
+    "CostBreakdown": "bifrost_eval.models.evaluation",
+    "CostEfficiencyMetric": "bifrost_eval.core.metrics",
+    "EvalResult": "bifrost_eval.models.evaluation",
+    "EvalRunner": "bifrost_eval.core.runner",
+    "EvalScore": "bifrost_eval.models.evaluation",
+    "EvalSuite": "bifrost_eval.models.evaluation",
+    "ExecutionTrace": "bifrost_eval.core.runner",
+    "GradeLevel": "bifrost_eval.models.evaluation",
+    "GradingStrategy": "bifrost_eval.core.scorer",
+    "LatencyBreakdown": "bifrost_eval.models.evaluation",
+    "LatencyMetric": "bifrost_eval.core.metrics",
+    "Metric": "bifrost_eval.core.metrics",
+    "PipelineExecutor": "bifrost_eval.core.runner",
+    "Scenario": "bifrost_eval.models.evaluation",
+    "ScenarioOutcome": "bifrost_eval.models.evaluation",
+    "Scorer": "bifrost_eval.core.scorer",
+    "ThresholdGrader": "bifrost_eval.core.scorer",
+    "ToolCallRecord": "bifrost_eval.models.evaluation",
+    "ToolCorrectnessMetric": "bifrost_eval.core.metrics",
+    "WeightedGrader": "bifrost_eval.core.scorer",
+}
+
 __all__ = [
     "AccuracyMetric",
     "ComparisonResult",
@@ -49,3 +83,16 @@ __all__ = [
     "ToolCorrectnessMetric",
     "WeightedGrader",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
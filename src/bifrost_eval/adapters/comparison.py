@@ -2,25 +2,45 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from pydantic import BaseModel, Field
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 from bifrost_eval.core.runner import EvalRunner, PipelineExecutor
 from bifrost_eval.core.scorer import Scorer
-from bifrost_eval.models.evaluation import EvalResult, EvalSuite  # noqa: TC001
+from bifrost_eval.models.evaluation import EvalResult
 
 if TYPE_CHECKING:
     from bifrost_eval.core.metrics import Metric
+    from bifrost_eval.models.evaluation import EvalSuite
+
 
+@dataclass(slots=True)
+class ComparisonResult:
+    """Result of comparing two or more pipeline configurations on the same suite.
 
-class ComparisonResult(BaseModel):
-    """Result of comparing two or more pipeline configurations on the same suite."""
+    A plain dataclass: it is built from already-validated ``EvalResult`` models,
+    so there is nothing for pydantic to validate.
+    """
 
     suite_name: str
-    results: dict[str, EvalResult] = Field(default_factory=dict)
+    results: dict[str, EvalResult] = field(default_factory=dict[str, EvalResult])
     winner: str = ""
-    summary: dict[str, Any] = Field(default_factory=dict)
+    summary: dict[str, Any] = field(default_factory=dict[str, Any])
+
+    def model_dump(self, mode: Literal["python", "json"] = "python") -> dict[str, Any]:
+        """Dict in the pydantic ``model_dump`` shape.
+
+        As with pydantic, the default ``"python"`` mode keeps datetimes and
+        enums in the nested results as objects; pass ``mode="json"`` for a dict
+        that ``json.dumps`` accepts.
+        """
+        return {
+            "suite_name": self.suite_name,
+            "results": {name: r.model_dump(mode=mode) for name, r in self.results.items()},
+            "winner": self.winner,
+            "summary": {name: dict(row) for name, row in self.summary.items()},
+        }
 
     def determine_winner(self) -> str:
         """Determine which configuration scored highest overall."""
@@ -28,34 +48,44 @@ class ComparisonResult(BaseModel):
             return ""
         best_name = ""
         best_score = -1.0
+        self.summary = {}
         for name, result in self.results.items():
-            if result.mean_score > best_score:
-                best_score = result.mean_score
+            # One pass over the outcomes for every value read below
+            totals = result.summary()
+            if totals.mean_score > best_score:
+                best_score = totals.mean_score
                 best_name = name
-        self.winner = best_name
-        self.summary = {
-            name: {
-                "mean_score": r.mean_score,
-                "pass_rate": r.pass_rate,
-                "total_cost_usd": r.total_cost.total_usd,
-                "total_latency_ms": r.total_latency.total_ms,
-                "grade": r.grade.value,
+            self.summary[name] = {
+                "mean_score": totals.mean_score,
+                "pass_rate": totals.pass_rate,
+                "total_cost_usd": result.total_cost.total_usd,
+                "total_latency_ms": result.total_latency.total_ms,
+                "grade": totals.grade.value,
             }
-            for name, r in self.results.items()
-        }
+        self.winner = best_name
         return best_name
 
 
 class ComparisonRunner:
-    """Run the same evaluation suite against multiple pipeline configurations."""
+    """Run the same evaluation suite against multiple pipeline configurations.
+
+    Configurations run concurrently. Set ``max_config_concurrency`` to cap how
+    many run at once when they share a rate-limited downstream API.
+    ``max_concurrency`` is passed to each configuration's ``EvalRunner`` and caps
+    the scenarios running at once within it.
+    """
 
     def __init__(
         self,
         metrics: list[Metric] | None = None,
         scorer: Scorer | None = None,
+        max_config_concurrency: int | None = None,
+        max_concurrency: int | None = None,
     ):
         self.metrics = metrics or []
         self.scorer = scorer or Scorer()
+        self.max_config_concurrency = max_config_concurrency
+        self.max_concurrency = max_concurrency
 
     async def compare(
         self,
@@ -64,14 +94,24 @@ class ComparisonRunner:
     ) -> ComparisonResult:
         """Run the suite against each configuration and compare results."""
         comparison = ComparisonResult(suite_name=suite.name)
+        executors = list(configurations.values())
+        if not executors:
+            return comparison
+
+        base = EvalRunner(
+            executor=executors[0],
+            metrics=self.metrics,
+            scorer=self.scorer,
+            max_concurrency=self.max_concurrency,
+        )
+        sem = asyncio.Semaphore(max(1, self.max_config_concurrency or len(executors)))
+
+        async def run_one(executor: PipelineExecutor) -> EvalResult:
+            async with sem:
+                return await base.with_executor(executor).run_suite(suite)
 
-        for name, executor in configurations.items():
-            runner = EvalRunner(
-                executor=executor,
-                metrics=self.metrics,
-                scorer=self.scorer,
-            )
-            result = await runner.run_suite(suite)
+        results = await asyncio.gather(*(run_one(e) for e in executors))
+        for name, result in zip(configurations, results, strict=True):
             comparison.results[name] = result
 
         comparison.determine_winner()
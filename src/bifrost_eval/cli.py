@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Any
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -46,18 +44,19 @@ def _cmd_validate(suite_file: str) -> int:
         print(f"Error: File not found: {suite_file}")
         return 1
 
-    try:
-        data: Any = json.loads(path.read_text())
-    except json.JSONDecodeError as exc:
-        print(f"Error: Invalid JSON: {exc}")
-        return 1
+    from pydantic import ValidationError
 
     from bifrost_eval.models.evaluation import EvalSuite
 
+    # Parse and validate in one pass with pydantic-core's JSON parser
     try:
-        suite = EvalSuite.model_validate(data)
-    except Exception as exc:
-        print(f"Error: Invalid suite format: {exc}")
+        suite = EvalSuite.model_validate_json(path.read_bytes())
+    except ValidationError as exc:
+        json_errors = [e for e in exc.errors() if e["type"] == "json_invalid"]
+        if json_errors:
+            print(f"Error: {json_errors[0]['msg']}")
+        else:
+            print(f"Error: Invalid suite format: {exc}")
         return 1
 
     print(f"Valid suite: {suite.name}")
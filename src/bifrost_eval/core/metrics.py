@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
 from bifrost_eval.models.evaluation import EvalScore, ScenarioOutcome
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class Metric(ABC):
-    """Base class for evaluation metrics."""
+    """Base class for evaluation metrics.
+
+    Set ``cpu_bound = True`` on metrics that block for milliseconds per score
+    (e.g. native code that releases the GIL) to run them in a worker thread.
+    Pure-Python scoring holds the GIL anyway, so the runner keeps it inline.
+    """
+
+    cpu_bound: bool = False
 
     def __init__(self, name: str, weight: float = 1.0):
         self.name = name
@@ -48,10 +59,13 @@ class AccuracyMetric(Metric):
         if expected is None:
             return self._excluded("no expected output defined")
 
+        actual = outcome.actual_output
         if self._comparator is not None:
-            match = bool(self._comparator(outcome.actual_output, expected))
+            match = bool(self._comparator(actual, expected))
         else:
-            match = outcome.actual_output == expected
+            # Identity first: skips a deep walk when the executor hands back
+            # the expected object itself
+            match = actual is expected or actual == expected
 
         return EvalScore(
             name=self.name,
@@ -82,16 +96,26 @@ class ToolCorrectnessMetric(Metric):
         if expected is None:
             return self._excluded("no expected tool calls defined")
 
-        raw = cast("list[str]", expected) if isinstance(expected, list) else list(expected)
-        expected_tools: list[str] = raw
+        expected_tools = (
+            cast("tuple[str, ...]", expected) if isinstance(expected, tuple) else tuple(expected)
+        )
         actual_tools = outcome.tool_call_names
 
         if not expected_tools:
             return self._excluded("no expected tool calls defined")
 
+        # Fast paths: nothing called, or exactly the expected sequence. Every
+        # component is then 0 or 1, so skip the set and LCS work.
+        if not actual_tools or (
+            len(actual_tools) == len(expected_tools) and tuple(actual_tools) == expected_tools
+        ):
+            hit = 1.0 if actual_tools else 0.0
+            order = hit if self.check_order else None
+            return self._scored(hit, hit, order, 0, expected_tools, actual_tools)
+
         # Presence score: what fraction of expected tools were called?
         called_set = set(actual_tools)
-        expected_set = set(expected_tools)
+        expected_set = _distinct_tools(expected_tools)
         presence = len(called_set & expected_set) / len(expected_set)
 
         # Order score: longest common subsequence ratio
@@ -104,13 +128,24 @@ class ToolCorrectnessMetric(Metric):
 
         # Penalty for extra unexpected tools
         extras = called_set - expected_set
-        extra_penalty = len(extras) / max(len(actual_tools), 1)
+        extra_penalty = len(extras) / len(actual_tools)
 
         value = max(0.0, min(1.0, base * (1.0 - extra_penalty * 0.2)))
+        return self._scored(value, presence, order_score, len(extras), expected_tools, actual_tools)
+
+    def _scored(
+        self,
+        value: float,
+        presence: float,
+        order_score: float | None,
+        extras: int,
+        expected_tools: tuple[str, ...],
+        actual_tools: list[str],
+    ) -> EvalScore:
         order_detail = f"{order_score:.2f}" if order_score is not None else "not checked"
         details = (
             f"Presence: {presence:.2f}, Order: {order_detail}, "
-            f"Extras: {len(extras)}, Expected: {expected_tools}, Actual: {actual_tools}"
+            f"Extras: {extras}, Expected: {list(expected_tools)}, Actual: {actual_tools}"
         )
         return EvalScore(name=self.name, value=value, weight=self.weight, details=details)
 
@@ -164,20 +199,30 @@ class CostEfficiencyMetric(Metric):
         )
 
 
-def _lcs_ratio(expected: list[str], actual: list[str]) -> float:
-    """Longest common subsequence ratio between two tool call sequences."""
+@lru_cache(maxsize=1024)
+def _distinct_tools(tools: tuple[str, ...]) -> frozenset[str]:
+    """Distinct expected tool names, shared across repeated scoring of a scenario."""
+    return frozenset(tools)
+
+
+def _lcs_ratio(expected: Sequence[str], actual: Sequence[str]) -> float:
+    """Longest common subsequence ratio between two tool call sequences.
+
+    Bit-parallel LCS (Allison-Dix / Hyyrö): each tool name in ``actual`` maps to
+    a bitmask of its positions, and one row of the DP table is packed into a
+    single int, so each expected tool costs a few bigint ops instead of a
+    Python-level pass over ``actual``.
+    """
     if not expected or not actual:
         return 0.0
 
-    m, n = len(expected), len(actual)
-    dp: list[list[int]] = [[0] * (n + 1) for _ in range(m + 1)]
+    masks: dict[str, int] = {}
+    for i, tool in enumerate(actual):
+        masks[tool] = masks.get(tool, 0) | (1 << i)
 
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if expected[i - 1] == actual[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+    row = 0
+    for tool in expected:
+        x = row | masks.get(tool, 0)
+        row = x & ((x - ((row << 1) | 1)) ^ x)
 
-    lcs_len = dp[m][n]
-    return lcs_len / m
+    return row.bit_count() / len(expected)
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import math
+import os
 import time
-from typing import TYPE_CHECKING, Any, Protocol
+from collections import defaultdict
+from datetime import UTC, datetime
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from bifrost_eval.core.scorer import Scorer
 from bifrost_eval.models.evaluation import (
@@ -18,7 +24,14 @@ from bifrost_eval.models.evaluation import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from bifrost_eval.core.metrics import Metric
+    from bifrost_eval.models.evaluation import EvalScore
+
+# Executors are I/O-bound (LLM and tool calls), so run more scenarios at once
+# than there are cores. Same sizing rule as ThreadPoolExecutor's default.
+_DEFAULT_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
 
 
 class PipelineExecutor(Protocol):
@@ -35,6 +48,9 @@ class PipelineExecutor(Protocol):
 class ExecutionTrace:
     """Trace of a pipeline execution — output, tool calls, cost, latency."""
 
+    # One trace per scenario run; slots drop the per-instance __dict__
+    __slots__ = ("cost", "error", "latency", "output", "success", "tool_calls")
+
     def __init__(
         self,
         output: Any = None,
@@ -53,31 +69,51 @@ class ExecutionTrace:
 
 
 class EvalRunner:
-    """Runs evaluation suites against a pipeline executor."""
+    """Runs evaluation suites against a pipeline executor.
+
+    Scenarios in a suite run concurrently, at most ``max_concurrency`` at a
+    time. Pass ``max_concurrency=1`` for executors that are not safe to call
+    concurrently.
+    """
 
     def __init__(
         self,
         executor: PipelineExecutor,
         metrics: list[Metric] | None = None,
         scorer: Scorer | None = None,
-        max_concurrency: int = 1,
+        max_concurrency: int | None = None,
     ):
         self.executor = executor
         self.metrics = metrics or []
+        # Resolved on a metric's first use rather than per (metric, scenario)
+        # pair, so metrics added to self.metrics later are picked up too
+        self._expected_getters: dict[int, tuple[Metric, Callable[[Scenario], Any]]] = {}
         self.scorer = scorer or Scorer()
-        self.max_concurrency = max_concurrency
+        self.max_concurrency = (
+            max_concurrency if max_concurrency is not None else _DEFAULT_MAX_CONCURRENCY
+        )
+
+    def with_executor(self, executor: PipelineExecutor) -> EvalRunner:
+        """A copy of this runner bound to another executor.
+
+        Metrics, scorer, and per-runner setup are shared rather than rebuilt, so
+        the copy is cheap and safe to run alongside the original.
+        """
+        runner = copy.copy(self)
+        runner.executor = executor
+        return runner
 
     async def run_scenario(self, scenario: Scenario) -> ScenarioOutcome:
         """Run a single scenario and produce a scored outcome."""
-        start = time.monotonic()
+        start = time.monotonic_ns()
 
         try:
-            trace = await asyncio.wait_for(
-                self.executor.execute(scenario),
-                timeout=scenario.timeout_ms / 1000.0,
-            )
+            # asyncio.timeout runs the executor in the current task; on 3.11
+            # wait_for wraps it in an extra task plus a cancel callback
+            async with asyncio.timeout(scenario.timeout_ms / 1000.0):
+                trace = await self.executor.execute(scenario)
         except TimeoutError:
-            elapsed = (time.monotonic() - start) * 1000
+            elapsed = (time.monotonic_ns() - start) / 1e6
             return ScenarioOutcome(
                 scenario_name=scenario.name,
                 passed=False,
@@ -85,7 +121,7 @@ class EvalRunner:
                 latency=LatencyBreakdown(total_ms=elapsed),
             )
         except Exception as exc:
-            elapsed = (time.monotonic() - start) * 1000
+            elapsed = (time.monotonic_ns() - start) / 1e6
             return ScenarioOutcome(
                 scenario_name=scenario.name,
                 passed=False,
@@ -93,9 +129,10 @@ class EvalRunner:
                 latency=LatencyBreakdown(total_ms=elapsed),
             )
 
-        elapsed = (time.monotonic() - start) * 1000
-        if trace.latency.total_ms <= 0:
-            trace.latency.total_ms = elapsed
+        elapsed = (time.monotonic_ns() - start) / 1e6
+        latency = trace.latency
+        if latency.total_ms <= 0:
+            latency = latency.model_copy(update={"total_ms": elapsed})
 
         outcome = ScenarioOutcome(
             scenario_name=scenario.name,
@@ -103,38 +140,73 @@ class EvalRunner:
             actual_output=trace.output,
             tool_calls=trace.tool_calls,
             cost=trace.cost,
-            latency=trace.latency,
+            latency=latency,
             error=trace.error,
         )
 
-        # Apply metrics
-        for metric in self.metrics:
-            expected = _get_expected_for_metric(metric, scenario)
-            score = metric.score(outcome, expected)
-            outcome.scores.append(score)
+        outcome.scores.extend(await self._score_metrics(outcome, scenario))
 
         # Apply grading
         self.scorer.apply_grade(outcome)
         return outcome
 
-    async def run_suite(self, suite: EvalSuite) -> EvalResult:
-        """Run all scenarios in a suite and produce aggregated results."""
-        if self.max_concurrency <= 1:
-            outcomes: list[ScenarioOutcome] = []
-            for scenario in suite.scenarios:
-                outcome = await self.run_scenario(scenario)
-                outcomes.append(outcome)
-        else:
-            sem = asyncio.Semaphore(self.max_concurrency)
-
-            async def run_with_sem(scenario: Scenario) -> ScenarioOutcome:
-                async with sem:
-                    return await self.run_scenario(scenario)
-
-            gathered: list[ScenarioOutcome] = list(
-                await asyncio.gather(*[run_with_sem(s) for s in suite.scenarios])
+    async def _score_metrics(self, outcome: ScenarioOutcome, scenario: Scenario) -> list[EvalScore]:
+        """Score every metric, in metric order.
+
+        CPU-bound metrics run in worker threads so the event loop keeps driving
+        other scenarios' I/O meanwhile. Scalar metrics stay inline — a thread
+        hop would cost more than the work itself.
+        """
+        scores: list[EvalScore | None] = [None] * len(self.metrics)
+        threaded: list[tuple[int, Metric, Any]] = []
+        for i, metric in enumerate(self.metrics):
+            expected = self._expected_getter_for(metric)(scenario)
+            if metric.cpu_bound:
+                threaded.append((i, metric, expected))
+            else:
+                scores[i] = metric.score(outcome, expected)
+
+        # Only start the threads once the inline metrics are done, so an inline
+        # failure doesn't leave to_thread coroutines that are never awaited
+        if threaded:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(m.score, outcome, e) for _, m, e in threaded)
             )
-            outcomes = gathered
+            for (i, _, _), score in zip(threaded, results, strict=True):
+                scores[i] = score
+        return cast("list[EvalScore]", scores)
+
+    def _expected_getter_for(self, metric: Metric) -> Callable[[Scenario], Any]:
+        entry = self._expected_getters.get(id(metric))
+        if entry is None:
+            # Keep the metric alongside its getter so its id can't be reused
+            entry = self._expected_getters[id(metric)] = (metric, _expected_getter(metric))
+        return entry[1]
+
+    async def run_suite(self, suite: EvalSuite) -> EvalResult:
+        """Run all scenarios in a suite and produce aggregated results.
+
+        Outcomes are collected as scenarios finish but returned in suite order.
+        The result's ``run_at`` is when the suite started.
+        """
+        run_at = datetime.now(UTC)
+        sem = asyncio.Semaphore(max(1, self.max_concurrency))
+        slots: list[ScenarioOutcome | None] = [None] * len(suite.scenarios)
+
+        async def run_into_slot(index: int, scenario: Scenario) -> None:
+            async with sem:
+                slots[index] = await self.run_scenario(scenario)
+
+        # TaskGroup cancels the remaining scenarios if one raises (e.g. a
+        # metric bug) instead of leaving them running unobserved
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i, scenario in enumerate(suite.scenarios):
+                    tg.create_task(run_into_slot(i, scenario))
+        except BaseExceptionGroup as group:
+            # Surface the original error, not the group wrapping it
+            raise group.exceptions[0] from None
+        outcomes = cast("list[ScenarioOutcome]", slots)
 
         total_cost = _aggregate_costs(outcomes)
         total_latency = _aggregate_latencies(outcomes)
@@ -144,52 +216,73 @@ class EvalRunner:
             outcomes=outcomes,
             total_cost=total_cost,
             total_latency=total_latency,
+            run_at=run_at,
         )
 
 
-def _get_expected_for_metric(metric: Metric, scenario: Scenario) -> Any:
-    """Extract the expected value for a specific metric from a scenario."""
+def _expected_getter(metric: Metric) -> Callable[[Scenario], Any]:
+    """Pick the function that extracts a metric's expected value from a scenario."""
     if metric.name == "accuracy":
-        return scenario.expected_output
+        return attrgetter("expected_output")
     if metric.name == "tool_correctness":
-        return scenario.expected_tool_calls
+        return attrgetter("expected_tool_calls")
+    return _no_expected
+
+
+def _no_expected(scenario: Scenario) -> None:
     return None
 
 
 def _aggregate_costs(outcomes: list[ScenarioOutcome]) -> CostBreakdown:
-    """Sum costs across all outcomes."""
-    total = CostBreakdown()
-    for o in outcomes:
-        total.total_usd += o.cost.total_usd
-        total.input_tokens += o.cost.input_tokens
-        total.output_tokens += o.cost.output_tokens
-        total.input_cost_usd += o.cost.input_cost_usd
-        total.output_cost_usd += o.cost.output_cost_usd
-        for agent, cost in o.cost.per_agent.items():
-            total.per_agent[agent] = total.per_agent.get(agent, 0.0) + cost
-        for tool, cost in o.cost.per_tool.items():
-            total.per_tool[tool] = total.per_tool.get(tool, 0.0) + cost
-    return total
+    """Sum costs across all outcomes.
+
+    Dollar totals, including the per-agent and per-tool ones, use ``math.fsum``
+    so long suites of small per-call costs don't accumulate rounding drift.
+    """
+    costs = [o.cost for o in outcomes]
+    per_agent: defaultdict[str, list[float]] = defaultdict(list)
+    per_tool: defaultdict[str, list[float]] = defaultdict(list)
+    for c in costs:
+        for agent, cost in c.per_agent.items():
+            per_agent[agent].append(cost)
+        for tool, cost in c.per_tool.items():
+            per_tool[tool].append(cost)
+
+    return CostBreakdown(
+        total_usd=math.fsum(c.total_usd for c in costs),
+        input_tokens=sum(c.input_tokens for c in costs),
+        output_tokens=sum(c.output_tokens for c in costs),
+        input_cost_usd=math.fsum(c.input_cost_usd for c in costs),
+        output_cost_usd=math.fsum(c.output_cost_usd for c in costs),
+        per_agent={agent: math.fsum(v) for agent, v in per_agent.items()},
+        per_tool={tool: math.fsum(v) for tool, v in per_tool.items()},
+    )
 
 
 def _aggregate_latencies(outcomes: list[ScenarioOutcome]) -> LatencyBreakdown:
-    """Aggregate latency stats across outcomes."""
+    """Aggregate latency stats across outcomes in a single pass."""
     if not outcomes:
         return LatencyBreakdown()
 
-    times = sorted(o.latency.total_ms for o in outcomes)
-    total = LatencyBreakdown(
+    times: list[float] = []
+    per_agent: defaultdict[str, float] = defaultdict(float)
+    per_tool: defaultdict[str, float] = defaultdict(float)
+    for o in outcomes:
+        times.append(o.latency.total_ms)
+        for agent, ms in o.latency.per_agent.items():
+            per_agent[agent] += ms
+        for tool, ms in o.latency.per_tool.items():
+            per_tool[tool] += ms
+
+    times.sort()
+    return LatencyBreakdown(
         total_ms=sum(times),
+        per_agent=dict(per_agent),
+        per_tool=dict(per_tool),
         p50_ms=_percentile(times, 50),
         p95_ms=_percentile(times, 95),
         p99_ms=_percentile(times, 99),
     )
-    for o in outcomes:
-        for agent, ms in o.latency.per_agent.items():
-            total.per_agent[agent] = total.per_agent.get(agent, 0.0) + ms
-        for tool, ms in o.latency.per_tool.items():
-            total.per_tool[tool] = total.per_tool.get(tool, 0.0) + ms
-    return total
 
 
 def _percentile(sorted_values: list[float], pct: int) -> float:
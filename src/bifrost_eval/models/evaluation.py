@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_right
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from functools import partial
+from typing import Annotated, Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 
 class GradeLevel(StrEnum):
@@ -19,10 +22,32 @@ class GradeLevel(StrEnum):
     FAIL = "fail"
 
 
+# Lower bounds of each grade above FAIL, ascending, for EvalResult.grade
+_GRADE_THRESHOLDS = (0.4, 0.6, 0.75, 0.9)
+_GRADES = (
+    GradeLevel.FAIL,
+    GradeLevel.POOR,
+    GradeLevel.ACCEPTABLE,
+    GradeLevel.GOOD,
+    GradeLevel.EXCELLENT,
+)
+
+
+def _grade_for(mean_score: float) -> GradeLevel:
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, mean_score)]
+
+
+# Tool names repeat across every scenario; interning shares one string per
+# name and lets ToolCorrectnessMetric's comparisons short-circuit on identity
+_ToolName = Annotated[str, AfterValidator(sys.intern)]
+
+
 class ToolCallRecord(BaseModel):
     """Record of a single tool/MCP call during evaluation."""
 
-    tool_name: str
+    model_config = ConfigDict(frozen=True)
+
+    tool_name: _ToolName
     arguments: dict[str, Any] = Field(default_factory=dict)
     result: Any = None
     success: bool = True
@@ -47,6 +72,8 @@ class CostBreakdown(BaseModel):
 class LatencyBreakdown(BaseModel):
     """Latency attribution for an evaluation run."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_ms: float = 0.0
     per_agent: dict[str, float] = Field(default_factory=dict)
     per_tool: dict[str, float] = Field(default_factory=dict)
@@ -58,6 +85,8 @@ class LatencyBreakdown(BaseModel):
 class EvalScore(BaseModel):
     """A single scored dimension of an evaluation."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     value: float = Field(ge=0.0, le=1.0)
     weight: float = Field(default=1.0, ge=0.0)
@@ -71,7 +100,7 @@ class Scenario(BaseModel):
     description: str = ""
     input_data: dict[str, Any] = Field(default_factory=dict)
     expected_output: Any = None
-    expected_tool_calls: list[str] = Field(default_factory=list)
+    expected_tool_calls: list[_ToolName] = Field(default_factory=list)
     tags: list[str] = Field(default_factory=list)
     timeout_ms: float = 30000.0
     metadata: dict[str, Any] = Field(default_factory=dict)
@@ -82,9 +111,9 @@ class ScenarioOutcome(BaseModel):
 
     scenario_name: str
     passed: bool
-    scores: list[EvalScore] = Field(default_factory=lambda: list[EvalScore]())
+    scores: list[EvalScore] = Field(default_factory=list[EvalScore])
     actual_output: Any = None
-    tool_calls: list[ToolCallRecord] = Field(default_factory=lambda: list[ToolCallRecord]())
+    tool_calls: list[ToolCallRecord] = Field(default_factory=list[ToolCallRecord])
     cost: CostBreakdown = Field(default_factory=CostBreakdown)
     latency: LatencyBreakdown = Field(default_factory=LatencyBreakdown)
     error: str | None = None
@@ -92,13 +121,15 @@ class ScenarioOutcome(BaseModel):
 
     @property
     def weighted_score(self) -> float:
-        """Calculate weighted average score across all dimensions."""
-        if not self.scores:
-            return 0.0
-        total_weight = sum(s.weight for s in self.scores)
+        """Weighted average score across all dimensions, in one pass over the scores."""
+        total_weight = 0.0
+        weighted_sum = 0.0
+        for s in self.scores:
+            total_weight += s.weight
+            weighted_sum += s.value * s.weight
         if total_weight == 0.0:
             return 0.0
-        return sum(s.value * s.weight for s in self.scores) / total_weight
+        return weighted_sum / total_weight
 
     @property
     def tool_call_names(self) -> list[str]:
@@ -106,22 +137,55 @@ class ScenarioOutcome(BaseModel):
         return [tc.tool_name for tc in self.tool_calls]
 
 
+class _ResultSummary(NamedTuple):
+    """One-pass totals for reading several of EvalResult's summary values at once."""
+
+    total: int
+    passed: int
+    score_sum: float
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.total if self.total else 0.0
+
+    @property
+    def mean_score(self) -> float:
+        return self.score_sum / self.total if self.total else 0.0
+
+    @property
+    def grade(self) -> GradeLevel:
+        return _grade_for(self.mean_score)
+
+
 class EvalResult(BaseModel):
     """Aggregated result from an entire evaluation suite run."""
 
     suite_name: str
-    outcomes: list[ScenarioOutcome] = Field(default_factory=lambda: list[ScenarioOutcome]())
+    outcomes: list[ScenarioOutcome] = Field(default_factory=list[ScenarioOutcome])
     total_cost: CostBreakdown = Field(default_factory=CostBreakdown)
     total_latency: LatencyBreakdown = Field(default_factory=LatencyBreakdown)
-    run_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    run_at: datetime = Field(default_factory=partial(datetime.now, UTC))
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    def summary(self) -> _ResultSummary:
+        """Count passes and sum weighted scores in one pass over the outcomes.
+
+        Each summary property walks the outcomes on its own; use this when
+        reading several of them for the same result.
+        """
+        passed = 0
+        score_sum = 0.0
+        for o in self.outcomes:
+            passed += o.passed
+            score_sum += o.weighted_score
+        return _ResultSummary(len(self.outcomes), passed, score_sum)
+
     @property
     def pass_rate(self) -> float:
         """Fraction of scenarios that passed."""
         if not self.outcomes:
             return 0.0
-        return sum(1 for o in self.outcomes if o.passed) / len(self.outcomes)
+        return self.passed_count / len(self.outcomes)
 
     @property
     def mean_score(self) -> float:
@@ -133,16 +197,7 @@ class EvalResult(BaseModel):
     @property
     def grade(self) -> GradeLevel:
         """Overall grade based on mean score."""
-        score = self.mean_score
-        if score >= 0.9:
-            return GradeLevel.EXCELLENT
-        if score >= 0.75:
-            return GradeLevel.GOOD
-        if score >= 0.6:
-            return GradeLevel.ACCEPTABLE
-        if score >= 0.4:
-            return GradeLevel.POOR
-        return GradeLevel.FAIL
+        return _grade_for(self.mean_score)
 
     @property
     def passed_count(self) -> int:
@@ -150,7 +205,7 @@ class EvalResult(BaseModel):
 
     @property
     def failed_count(self) -> int:
-        return sum(1 for o in self.outcomes if not o.passed)
+        return len(self.outcomes) - self.passed_count
 
 
 class EvalSuite(BaseModel):
@@ -158,6 +213,6 @@ class EvalSuite(BaseModel):
 
     name: str
     description: str = ""
-    scenarios: list[Scenario] = Field(default_factory=lambda: list[Scenario]())
+    scenarios: list[Scenario] = Field(default_factory=list[Scenario])
     tags: list[str] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
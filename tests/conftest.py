@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from bifrost_eval.core.runner import ExecutionTrace
 from bifrost_eval.models.evaluation import (
     CostBreakdown,
+    EvalScore,
     EvalSuite,
     LatencyBreakdown,
     Scenario,
+    ScenarioOutcome,
     ToolCallRecord,
 )
 
@@ -43,8 +47,6 @@ class MockExecutor:
         self.call_count += 1
         self.last_scenario = scenario
         if self.delay_ms > 0:
-            import asyncio
-
             await asyncio.sleep(self.delay_ms / 1000.0)
         if self.raise_error is not None:
             raise self.raise_error
@@ -58,6 +60,32 @@ class MockExecutor:
         )
 
 
+class InFlightExecutor:
+    """Sleeps for each scenario's ``delay_ms`` input and records peak concurrency.
+
+    Pass one instance as several comparison configurations to track their
+    combined concurrency.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute(self, scenario: Scenario) -> ExecutionTrace:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(scenario.input_data["delay_ms"] / 1000.0)
+        self.in_flight -= 1
+        return ExecutionTrace(output=scenario.name)
+
+
+def make_outcome(value: float, name: str = "acc", passed: bool = True) -> ScenarioOutcome:
+    """A single-score outcome, as graders see it."""
+    return ScenarioOutcome(
+        scenario_name="test", passed=passed, scores=[EvalScore(name=name, value=value)]
+    )
+
+
 @pytest.fixture
 def mock_executor() -> MockExecutor:
     return MockExecutor()
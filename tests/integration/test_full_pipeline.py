@@ -185,7 +185,7 @@ class TestFullEvalPipeline:
             name="error-recovery",
             scenarios=[
                 Scenario(name="ok-1", expected_output="fine"),
-                Scenario(name="timeout", timeout_ms=50),
+                Scenario(name="timeout", timeout_ms=1),
                 Scenario(name="ok-2", expected_output="fine"),
             ],
         )
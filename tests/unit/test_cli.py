@@ -3,17 +3,30 @@
 from __future__ import annotations
 
 import json
-import tempfile
+import subprocess
+import sys
+from typing import TYPE_CHECKING
 
 import pytest
 
 from bifrost_eval.cli import main
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestCLI:
     def test_version(self) -> None:
         assert main(["--version"]) == 0
 
+    def test_version_skips_engine_import(self) -> None:
+        # Package exports load lazily, so --version never pulls in pydantic
+        code = (
+            "import sys; from bifrost_eval.cli import main; main(['--version']); "
+            "assert 'pydantic' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
     def test_no_args(self) -> None:
         assert main([]) == 0
 
@@ -22,35 +35,36 @@ class TestCLI:
         with pytest.raises(SystemExit):
             main(["run", "suite.json"])
 
-    def test_validate_valid_suite(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump(
+    def test_validate_valid_suite(self, tmp_path: Path) -> None:
+        suite_file = tmp_path / "suite.json"
+        suite_file.write_text(
+            json.dumps(
                 {
                     "name": "test-suite",
                     "scenarios": [
                         {"name": "s1", "input_data": {"q": "hi"}},
                     ],
-                },
-                f,
+                }
             )
-            f.flush()
-            result = main(["validate", f.name])
-        assert result == 0
-
-    def test_validate_invalid_json(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            f.write("not json")
-            f.flush()
-            result = main(["validate", f.name])
-        assert result == 1
+        )
+        assert main(["validate", str(suite_file)]) == 0
+
+    def test_validate_invalid_json(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        suite_file = tmp_path / "suite.json"
+        suite_file.write_text("not json")
+        assert main(["validate", str(suite_file)]) == 1
+        assert "Error: Invalid JSON" in capsys.readouterr().out
 
     def test_validate_missing_file(self) -> None:
         result = main(["validate", "/nonexistent/file.json"])
         assert result == 1
 
-    def test_validate_invalid_schema(self) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({"scenarios": "not a list"}, f)
-            f.flush()
-            result = main(["validate", f.name])
-        assert result == 1
+    def test_validate_invalid_schema(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        suite_file = tmp_path / "suite.json"
+        suite_file.write_text(json.dumps({"scenarios": "not a list"}))
+        assert main(["validate", str(suite_file)]) == 1
+        assert "Error: Invalid suite format" in capsys.readouterr().out
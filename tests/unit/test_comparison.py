@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from bifrost_eval.adapters.comparison import ComparisonResult, ComparisonRunner
 from bifrost_eval.core.metrics import AccuracyMetric
 from bifrost_eval.models.evaluation import (
     CostBreakdown,
+    EvalResult,
     EvalSuite,
     Scenario,
 )
-from tests.conftest import MockExecutor
+from tests.conftest import InFlightExecutor, MockExecutor
 
 
 class TestComparisonResult:
@@ -53,6 +56,24 @@ class TestComparisonResult:
         assert "config-a" in result.summary
         assert "config-b" in result.summary
 
+    def test_model_dump(self) -> None:
+        result = ComparisonResult(suite_name="test", results={"a": EvalResult(suite_name="test")})
+        result.determine_winner()
+        dumped = result.model_dump()
+        assert dumped["winner"] == "a"
+        assert dumped["results"]["a"]["suite_name"] == "test"
+        assert dumped["summary"]["a"]["mean_score"] == 0.0
+        # Editing the dump must not reach back into the result
+        dumped["summary"]["a"]["mean_score"] = 1.0
+        dumped["summary"].clear()
+        assert result.summary["a"]["mean_score"] == 0.0
+
+    def test_model_dump_json_mode(self) -> None:
+        result = ComparisonResult(suite_name="test", results={"a": EvalResult(suite_name="test")})
+        result.determine_winner()
+        reloaded = json.loads(json.dumps(result.model_dump(mode="json")))
+        assert EvalResult.model_validate(reloaded["results"]["a"]) == result.results["a"]
+
 
 class TestComparisonRunner:
     @pytest.mark.asyncio
@@ -106,3 +127,31 @@ class TestComparisonRunner:
         cheap_cost = result.summary["cheap"]["total_cost_usd"]
         expensive_cost = result.summary["expensive"]["total_cost_usd"]
         assert cheap_cost < expensive_cost
+
+    @pytest.mark.asyncio
+    async def test_configs_run_concurrently(self) -> None:
+        suite = EvalSuite(name="s", scenarios=[Scenario(name="s1", input_data={"delay_ms": 10})])
+        executor = InFlightExecutor()
+        runner = ComparisonRunner(metrics=[AccuracyMetric()])
+        result = await runner.compare(suite, {"a": executor, "b": executor})
+        assert executor.peak == 2
+        assert list(result.results) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_max_config_concurrency(self) -> None:
+        suite = EvalSuite(name="s", scenarios=[Scenario(name="s1", input_data={"delay_ms": 10})])
+        executor = InFlightExecutor()
+        runner = ComparisonRunner(metrics=[AccuracyMetric()], max_config_concurrency=1)
+        await runner.compare(suite, {"a": executor, "b": executor})
+        assert executor.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_reaches_each_config(self) -> None:
+        suite = EvalSuite(
+            name="s",
+            scenarios=[Scenario(name=f"s{i}", input_data={"delay_ms": 5}) for i in range(3)],
+        )
+        executor = InFlightExecutor()
+        runner = ComparisonRunner(max_config_concurrency=1, max_concurrency=1)
+        await runner.compare(suite, {"a": executor, "b": executor})
+        assert executor.peak == 1
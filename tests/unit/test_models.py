@@ -6,6 +6,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
+from bifrost_eval.core.scorer import Scorer
 from bifrost_eval.models.evaluation import (
     CostBreakdown,
     EvalResult,
@@ -28,6 +29,12 @@ class TestToolCallRecord:
         assert record.duration_ms == 0.0
         assert record.arguments == {}
 
+    def test_tool_name_interned(self) -> None:
+        # Built at runtime so the two names start out as distinct objects
+        record = ToolCallRecord(tool_name="".join(["calc", "ulator"]))
+        scenario = Scenario(name="s", expected_tool_calls=["".join(["calc", "ulator"])])
+        assert record.tool_name is scenario.expected_tool_calls[0]
+
     def test_with_error(self) -> None:
         record = ToolCallRecord(
             tool_name="fail-tool", success=False, error="connection timeout"
@@ -85,6 +92,11 @@ class TestEvalScore:
         score = EvalScore(name="prop-test", value=value)
         assert 0.0 <= score.value <= 1.0
 
+    def test_frozen(self) -> None:
+        score = EvalScore(name="accuracy", value=0.85)
+        with pytest.raises(ValueError):
+            score.value = 1.0  # type: ignore[misc]
+
 
 class TestScenarioOutcome:
     def test_weighted_score_empty(self) -> None:
@@ -119,6 +131,16 @@ class TestScenarioOutcome:
         )
         assert outcome.weighted_score == 0.0
 
+    def test_graded_outcome_round_trips(self) -> None:
+        outcome = Scorer().apply_grade(
+            ScenarioOutcome(
+                scenario_name="test",
+                passed=True,
+                scores=[EvalScore(name="acc", value=0.8)],
+            )
+        )
+        assert ScenarioOutcome.model_validate(outcome.model_dump()) == outcome
+
     def test_tool_call_names(self) -> None:
         outcome = ScenarioOutcome(
             scenario_name="test",
@@ -135,6 +157,14 @@ class TestScenarioOutcome:
         outcome = ScenarioOutcome(scenario_name="test", passed=True)
         assert outcome.tool_call_names == []
 
+    def test_tool_call_names_follow_copies(self) -> None:
+        outcome = ScenarioOutcome(
+            scenario_name="test", passed=True, tool_calls=[ToolCallRecord(tool_name="a")]
+        )
+        assert outcome.tool_call_names == ["a"]
+        copied = outcome.model_copy(update={"tool_calls": [ToolCallRecord(tool_name="z")]})
+        assert copied.tool_call_names == ["z"]
+
 
 class TestScenario:
     def test_basic_scenario(self) -> None:
@@ -273,6 +303,61 @@ class TestEvalResult:
         )
         assert result.grade == GradeLevel.POOR
 
+    @pytest.mark.parametrize(
+        ("value", "grade"),
+        [
+            (0.9, GradeLevel.EXCELLENT),
+            (0.75, GradeLevel.GOOD),
+            (0.6, GradeLevel.ACCEPTABLE),
+            (0.4, GradeLevel.POOR),
+            (0.39, GradeLevel.FAIL),
+        ],
+    )
+    def test_grade_boundaries(self, value: float, grade: GradeLevel) -> None:
+        result = EvalResult(
+            suite_name="test",
+            outcomes=[
+                ScenarioOutcome(
+                    scenario_name="a", passed=True, scores=[EvalScore(name="acc", value=value)]
+                ),
+            ],
+        )
+        assert result.grade == grade
+
+    def test_summary_follows_outcomes(self) -> None:
+        result = EvalResult(
+            suite_name="test",
+            outcomes=[ScenarioOutcome(scenario_name="a", passed=False)],
+        )
+        assert result.pass_rate == 0.0
+        result.outcomes.append(ScenarioOutcome(scenario_name="b", passed=True))
+        assert result.passed_count == 1
+        assert result.pass_rate == 0.5
+
+    def test_summary_matches_properties(self) -> None:
+        result = EvalResult(
+            suite_name="test",
+            outcomes=[
+                ScenarioOutcome(
+                    scenario_name="a", passed=True, scores=[EvalScore(name="acc", value=0.8)]
+                ),
+                ScenarioOutcome(
+                    scenario_name="b", passed=False, scores=[EvalScore(name="acc", value=0.2)]
+                ),
+            ],
+        )
+        summary = result.summary()
+        assert (summary.total, summary.passed) == (2, 1)
+        assert summary.pass_rate == result.pass_rate == 0.5
+        assert summary.mean_score == pytest.approx(result.mean_score)
+        assert summary.grade == result.grade == GradeLevel.POOR
+
+    def test_summary_empty(self) -> None:
+        summary = EvalResult(suite_name="test").summary()
+        assert summary.pass_rate == 0.0
+        assert summary.mean_score == 0.0
+        assert summary.grade == GradeLevel.FAIL
+
 
 class TestEvalSuite:
     def test_basic_suite(self) -> None:
@@ -2,18 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
+import threading
+import warnings
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
 import pytest
 
-from bifrost_eval.core.metrics import AccuracyMetric, LatencyMetric, ToolCorrectnessMetric
+from bifrost_eval.core.metrics import (
+    AccuracyMetric,
+    LatencyMetric,
+    Metric,
+    ToolCorrectnessMetric,
+)
 from bifrost_eval.core.runner import EvalRunner, ExecutionTrace, _percentile
 from bifrost_eval.models.evaluation import (
     CostBreakdown,
+    EvalResult,
+    EvalScore,
     EvalSuite,
     LatencyBreakdown,
     Scenario,
+    ScenarioOutcome,
     ToolCallRecord,
 )
-from tests.conftest import MockExecutor
+from tests.conftest import InFlightExecutor, MockExecutor
+
+
+class ThreadRecordingMetric(Metric):
+    """Records which thread scored it."""
+
+    def __init__(self, name: str, cpu_bound: bool):
+        super().__init__(name)
+        self.cpu_bound = cpu_bound
+        self.thread_id: int | None = None
+
+    def score(self, outcome: ScenarioOutcome, expected: Any | None = None) -> EvalScore:
+        self.thread_id = threading.get_ident()
+        return EvalScore(name=self.name, value=1.0)
+
+
+class FailingMetric(Metric):
+    """Raises from score()."""
+
+    def __init__(self) -> None:
+        super().__init__("failing")
+
+    def score(self, outcome: ScenarioOutcome, expected: Any | None = None) -> EvalScore:
+        raise ValueError("metric failed")
 
 
 class TestEvalRunner:
@@ -47,10 +85,19 @@ class TestEvalRunner:
         assert outcome.passed is False
         assert "boom" in (outcome.error or "")
 
+    @pytest.mark.asyncio
+    async def test_measured_latency_leaves_trace_untouched(self, simple_scenario: Scenario) -> None:
+        executor = MockExecutor(delay_ms=1)
+        runner = EvalRunner(executor=executor)
+        outcome = await runner.run_scenario(simple_scenario)
+        assert outcome.latency.total_ms > 0
+        assert executor.latency.total_ms == 0.0
+
     @pytest.mark.asyncio
     async def test_run_scenario_timeout(self) -> None:
+        # A 1ms budget still goes through the runner's real timeout path
         executor = MockExecutor(delay_ms=5000)
-        scenario = Scenario(name="slow", timeout_ms=100)
+        scenario = Scenario(name="slow", timeout_ms=1)
         runner = EvalRunner(executor=executor)
         outcome = await runner.run_scenario(scenario)
         assert outcome.passed is False
@@ -68,6 +115,19 @@ class TestEvalRunner:
         assert len(result.outcomes) == 1
         assert result.pass_rate > 0
 
+    @pytest.mark.asyncio
+    async def test_run_at_is_suite_start(self, simple_suite: EvalSuite) -> None:
+        runner = EvalRunner(executor=MockExecutor(delay_ms=20))
+        before = datetime.now(UTC)
+        result = await runner.run_suite(simple_suite)
+        assert before <= result.run_at < before + timedelta(milliseconds=20)
+
+    @pytest.mark.asyncio
+    async def test_result_round_trips_json(self, multi_scenario_suite: EvalSuite) -> None:
+        runner = EvalRunner(executor=MockExecutor(output=10), metrics=[AccuracyMetric()])
+        result = await runner.run_suite(multi_scenario_suite)
+        assert EvalResult.model_validate_json(result.model_dump_json()) == result
+
     @pytest.mark.asyncio
     async def test_run_suite_multiple(self, multi_scenario_suite: EvalSuite) -> None:
         executor = MockExecutor(output=10)
@@ -93,6 +153,38 @@ class TestEvalRunner:
         assert len(result.outcomes) == 3
         assert executor.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_run_suite_concurrent_by_default(self) -> None:
+        suite = EvalSuite(
+            name="slow",
+            scenarios=[Scenario(name=f"s{i}", input_data={"delay_ms": 20}) for i in range(3)],
+        )
+        executor = InFlightExecutor()
+        await EvalRunner(executor=executor).run_suite(suite)
+        assert executor.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_run_suite_sequential_when_limited(self) -> None:
+        suite = EvalSuite(
+            name="slow",
+            scenarios=[Scenario(name=f"s{i}", input_data={"delay_ms": 5}) for i in range(3)],
+        )
+        executor = InFlightExecutor()
+        await EvalRunner(executor=executor, max_concurrency=1).run_suite(suite)
+        assert executor.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_run_suite_keeps_suite_order(self) -> None:
+        # Later scenarios finish first; outcomes must still follow the suite
+        suite = EvalSuite(
+            name="ordered",
+            scenarios=[
+                Scenario(name=f"s{i}", input_data={"delay_ms": 30 - i * 10}) for i in range(3)
+            ],
+        )
+        result = await EvalRunner(executor=InFlightExecutor()).run_suite(suite)
+        assert [o.scenario_name for o in result.outcomes] == ["s0", "s1", "s2"]
+
     @pytest.mark.asyncio
     async def test_multiple_metrics(self, simple_scenario: Scenario) -> None:
         executor = MockExecutor(
@@ -118,6 +210,60 @@ class TestEvalRunner:
         assert "tool_correctness" in score_names
         assert "latency" in score_names
 
+    @pytest.mark.asyncio
+    async def test_cpu_bound_metrics_score_off_loop(self, simple_scenario: Scenario) -> None:
+        inline = ThreadRecordingMetric("inline", cpu_bound=False)
+        threaded = ThreadRecordingMetric("threaded", cpu_bound=True)
+        runner = EvalRunner(executor=MockExecutor(), metrics=[threaded, inline])
+        outcome = await runner.run_scenario(simple_scenario)
+        assert inline.thread_id == threading.get_ident()
+        assert threaded.thread_id != threading.get_ident()
+        # Scores keep metric order regardless of where they were computed
+        assert [s.name for s in outcome.scores] == ["threaded", "inline"]
+
+    @pytest.mark.asyncio
+    async def test_tool_scoring_follows_scenario_changes(self, simple_scenario: Scenario) -> None:
+        executor = MockExecutor(
+            tool_calls=[ToolCallRecord(tool_name="agent-a"), ToolCallRecord(tool_name="agent-b")]
+        )
+        runner = EvalRunner(executor=executor, metrics=[ToolCorrectnessMetric()])
+        first = await runner.run_scenario(simple_scenario)
+        assert first.scores[0].value == 1.0
+
+        # Copies and in-place edits must be scored against the new expectation
+        copied = simple_scenario.model_copy(update={"expected_tool_calls": ["agent-c"]})
+        assert (await runner.run_scenario(copied)).scores[0].value < 1.0
+        simple_scenario.expected_tool_calls.append("agent-c")
+        assert (await runner.run_scenario(simple_scenario)).scores[0].value < 1.0
+
+    @pytest.mark.asyncio
+    async def test_metrics_can_change_after_init(self, simple_scenario: Scenario) -> None:
+        runner = EvalRunner(executor=MockExecutor(), metrics=[LatencyMetric()])
+        await runner.run_scenario(simple_scenario)
+
+        runner.metrics.append(AccuracyMetric())
+        outcome = await runner.run_scenario(simple_scenario)
+        assert [s.name for s in outcome.scores] == ["latency", "accuracy"]
+        assert outcome.scores[1].value == 1.0
+
+        runner.metrics = [ToolCorrectnessMetric()]
+        outcome = await runner.run_scenario(simple_scenario)
+        assert [(s.name, s.value) for s in outcome.scores] == [("tool_correctness", 0.0)]
+
+    @pytest.mark.asyncio
+    async def test_inline_metric_error_leaves_no_pending_threads(
+        self, simple_scenario: Scenario
+    ) -> None:
+        threaded = ThreadRecordingMetric("threaded", cpu_bound=True)
+        runner = EvalRunner(executor=MockExecutor(), metrics=[threaded, FailingMetric()])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(ValueError, match="metric failed"):
+                await runner.run_scenario(simple_scenario)
+            gc.collect()
+        assert threaded.thread_id is None
+        assert not [w for w in caught if "never awaited" in str(w.message)]
+
     @pytest.mark.asyncio
     async def test_cost_aggregation(self, multi_scenario_suite: EvalSuite) -> None:
         executor = MockExecutor(
@@ -128,6 +274,30 @@ class TestEvalRunner:
         result = await runner.run_suite(multi_scenario_suite)
         assert result.total_cost.total_usd == pytest.approx(0.15)
 
+    @pytest.mark.asyncio
+    async def test_cost_aggregation_is_exact(self) -> None:
+        suite = EvalSuite(name="many", scenarios=[Scenario(name=f"s{i}") for i in range(10)])
+        executor = MockExecutor(
+            cost=CostBreakdown(total_usd=0.1, per_agent={"a": 0.1}, per_tool={"t": 0.1})
+        )
+        result = await EvalRunner(executor=executor).run_suite(suite)
+        # Naive float accumulation gives 0.9999999999999999
+        assert result.total_cost.total_usd == 1.0
+        assert result.total_cost.per_agent == {"a": 1.0}
+        assert result.total_cost.per_tool == {"t": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_latency_aggregation(self, multi_scenario_suite: EvalSuite) -> None:
+        executor = MockExecutor(
+            output=10,
+            latency=LatencyBreakdown(total_ms=100, per_agent={"a": 60}, per_tool={"t": 40}),
+        )
+        result = await EvalRunner(executor=executor).run_suite(multi_scenario_suite)
+        assert result.total_latency.total_ms == pytest.approx(300)
+        assert result.total_latency.p50_ms == pytest.approx(100)
+        assert result.total_latency.per_agent == pytest.approx({"a": 180})
+        assert result.total_latency.per_tool == pytest.approx({"t": 120})
+
     @pytest.mark.asyncio
     async def test_latency_fallback(self, simple_scenario: Scenario) -> None:
         """When trace has no latency, runner should use measured time."""
@@ -136,6 +306,34 @@ class TestEvalRunner:
         outcome = await runner.run_scenario(simple_scenario)
         assert outcome.latency.total_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_run_suite_error_cancels_siblings(self) -> None:
+        suite = EvalSuite(
+            name="mixed",
+            scenarios=[
+                Scenario(name="fast", input_data={"delay_ms": 0}),
+                Scenario(name="slow", input_data={"delay_ms": 5000}),
+            ],
+        )
+        executor = InFlightExecutor()
+        runner = EvalRunner(executor=executor, metrics=[FailingMetric()])
+        with pytest.raises(ValueError, match="metric failed"):
+            await runner.run_suite(suite)
+        # The slow scenario was cancelled, not left running
+        others = asyncio.all_tasks() - {asyncio.current_task()}
+        assert all(task.done() for task in others)
+
+    def test_with_executor_shares_setup(self) -> None:
+        metrics: list[Metric] = [AccuracyMetric()]
+        runner = EvalRunner(executor=MockExecutor(), metrics=metrics)
+        other_executor = MockExecutor()
+        other = runner.with_executor(other_executor)
+        assert other.executor is other_executor
+        assert other.metrics is runner.metrics
+        assert other.scorer is runner.scorer
+        assert other._expected_getters is runner._expected_getters
+        assert runner.executor is not other_executor
+
 
 class TestPercentile:
     def test_single_value(self) -> None:
@@ -166,6 +364,12 @@ class TestExecutionTrace:
         assert trace.success is True
         assert trace.error is None
 
+    def test_slotted(self) -> None:
+        trace = ExecutionTrace()
+        assert not hasattr(trace, "__dict__")
+        with pytest.raises(AttributeError):
+            trace.extra = 1  # type: ignore[attr-defined]
+
     def test_with_data(self) -> None:
         trace = ExecutionTrace(
             output="hello",